@@ -14,6 +14,7 @@ import pickle
 import os
 import json
 import math
+import heapq
 from collections import defaultdict, Counter
 import re
 from pathlib import Path
@@ -22,6 +23,11 @@ from crawl4ai.async_webcrawler import AsyncWebCrawler
 from crawl4ai.async_configs import CrawlerRunConfig, LinkPreviewConfig
 from crawl4ai.models import Link, CrawlResult
 import numpy as np
+import xxhash
+
+# Punctuation stripper used by StatisticalStrategy._tokenize (hot path)
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
 
 @dataclass
 class CrawlState:
@@ -52,29 +58,42 @@ class CrawlState:
     
     def save(self, path: Union[str, Path]):
         """Save state to disk for persistence"""
-        path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_state_dict(path, self.to_dict())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot the state as a JSON-serializable dict
         
+        Containers the crawl loop mutates in place (metrics, histories, term
+        statistics) are copied, so the snapshot can be written from a worker
+        thread while the crawl continues. Crawled pages are not modified after
+        they enter the knowledge base, so their links/metadata are shared.
+        """
         # Convert CrawlResult objects to dicts for serialization
-        state_dict = {
+        return {
             'crawled_urls': list(self.crawled_urls),
             'knowledge_base': [self._crawl_result_to_dict(cr) for cr in self.knowledge_base],
             'pending_links': [link.model_dump() for link in self.pending_links],
             'query': self.query,
-            'metrics': self.metrics,
+            'metrics': dict(self.metrics),
             'term_frequencies': dict(self.term_frequencies),
             'document_frequencies': dict(self.document_frequencies),
             'documents_with_terms': {k: list(v) for k, v in self.documents_with_terms.items()},
             'total_documents': self.total_documents,
-            'new_terms_history': self.new_terms_history,
-            'crawl_order': self.crawl_order,
+            'new_terms_history': list(self.new_terms_history),
+            'crawl_order': list(self.crawl_order),
             # Embedding-specific fields (convert numpy arrays to lists for JSON)
             'kb_embeddings': self.kb_embeddings.tolist() if self.kb_embeddings is not None else None,
             'query_embeddings': self.query_embeddings.tolist() if self.query_embeddings is not None else None,
-            'expanded_queries': self.expanded_queries,
-            'semantic_gaps': self.semantic_gaps,
+            'expanded_queries': list(self.expanded_queries),
+            'semantic_gaps': list(self.semantic_gaps),
             'embedding_model': self.embedding_model
         }
+    
+    @staticmethod
+    def _write_state_dict(path: Union[str, Path], state_dict: Dict[str, Any]):
+        """Write a state snapshot to disk"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(path, 'w') as f:
             json.dump(state_dict, f, indent=2)
@@ -283,6 +302,7 @@ class StatisticalStrategy(CrawlStrategy):
         self.idf_cache = {}
         self.bm25_k1 = 1.2  # BM25 parameter
         self.bm25_b = 0.75  # BM25 parameter
+        self._query_terms_cache: Tuple[str, List[str]] = ("", [])
         
     async def calculate_confidence(self, state: CrawlState) -> float:
         """Calculate confidence using coverage, consistency, and saturation"""
@@ -313,7 +333,7 @@ class StatisticalStrategy(CrawlStrategy):
         if not state.query or state.total_documents == 0:
             return 0.0
             
-        query_terms = self._tokenize(state.query.lower())
+        query_terms = self._get_query_terms(state.query)
         if not query_terms:
             return 0.0
             
@@ -349,14 +369,16 @@ class StatisticalStrategy(CrawlStrategy):
         if len(state.knowledge_base) < 2:
             return 1.0  # Single or no documents are perfectly consistent
             
+        # Tokenize each document once instead of once per pair
+        doc_terms = [set(self._get_document_terms(doc)) for doc in state.knowledge_base]
+        
         # Calculate pairwise term overlap
         overlaps = []
         
-        for i in range(len(state.knowledge_base)):
-            for j in range(i + 1, len(state.knowledge_base)):
-                # Get terms from both documents
-                terms_i = set(self._get_document_terms(state.knowledge_base[i]))
-                terms_j = set(self._get_document_terms(state.knowledge_base[j]))
+        for i in range(len(doc_terms)):
+            terms_i = doc_terms[i]
+            for j in range(i + 1, len(doc_terms)):
+                terms_j = doc_terms[j]
                 
                 if terms_i and terms_j:
                     # Jaccard similarity
@@ -438,7 +460,7 @@ class StatisticalStrategy(CrawlStrategy):
             return link.contextual_score
             
         # Otherwise, calculate simple term overlap
-        query_terms = set(self._tokenize(state.query.lower()))
+        query_terms = set(self._get_query_terms(state.query))
         link_terms = set(self._tokenize(link_text))
         
         if not query_terms:
@@ -573,10 +595,16 @@ class StatisticalStrategy(CrawlStrategy):
             # Add to crawl order
             state.crawl_order.append(result.url)
     
+    def _get_query_terms(self, query: str) -> List[str]:
+        """Tokenize the query once and reuse it for every link/document"""
+        if self._query_terms_cache[0] != query:
+            self._query_terms_cache = (query, self._tokenize(query.lower()))
+        return self._query_terms_cache[1]
+    
     def _tokenize(self, text: str) -> List[str]:
         """Simple tokenization - can be enhanced"""
         # Remove punctuation and split
-        text = re.sub(r'[^\w\s]', ' ', text)
+        text = _PUNCTUATION_RE.sub(' ', text)
         tokens = text.split()
         
         # Filter short tokens and stop words (basic)
@@ -596,7 +624,7 @@ class EmbeddingStrategy(CrawlStrategy):
     def __init__(self, embedding_model: str = None, llm_config: Dict = None):
         self.embedding_model = embedding_model or "sentence-transformers/all-MiniLM-L6-v2"
         self.llm_config = llm_config
-        self._embedding_cache = {}
+        self._embedding_cache = {}  # Text hash -> embedding
         self._link_embedding_cache = {}  # Cache for link embeddings
         self._validation_passed = False  # Track if validation passed
         
@@ -605,19 +633,38 @@ class EmbeddingStrategy(CrawlStrategy):
         self._kb_embeddings_hash = None  # Track KB changes
         self._validation_embeddings_cache = None  # Cache validation query embeddings
         self._kb_similarity_threshold = 0.95  # Threshold for deduplication
+        self._kb_content_hashes: Set[int] = set()  # Hashes of texts embedded into _kb_hashes_state's KB
+        self._kb_hashes_state: Optional[CrawlState] = None  # State the content hashes belong to
         
     async def _get_embeddings(self, texts: List[str]) -> Any:
-        """Get embeddings using configured method"""
+        """Get embeddings using configured method, serving repeated texts from cache"""
         from .utils import get_text_embeddings
-        embedding_llm_config = {
-            'provider': 'openai/text-embedding-3-small',
-            'api_token': os.getenv('OPENAI_API_KEY')
-        }
-        return await get_text_embeddings(
-            texts, 
-            embedding_llm_config,
-            self.embedding_model
-        )
+        if not texts:
+            return np.array([])
+        
+        # Only texts not seen before go to the embedding backend, in one batch
+        keys = [xxhash.xxh3_64_intdigest(text) for text in texts]
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in self._embedding_cache and key not in missing:
+                missing[key] = text
+        
+        if missing:
+            embedding_llm_config = {
+                'provider': 'openai/text-embedding-3-small',
+                'api_token': os.getenv('OPENAI_API_KEY')
+            }
+            new_embeddings = await get_text_embeddings(
+                list(missing.values()), 
+                embedding_llm_config,
+                self.embedding_model
+            )
+            # Stored as float32: API backends return float64, which doubles cache
+            # memory without changing similarity rankings
+            for key, embedding in zip(missing, new_embeddings):
+                self._embedding_cache[key] = np.asarray(embedding, dtype=np.float32)
+        
+        return np.array([self._embedding_cache[key] for key in keys])
     
     def _compute_distance_matrix(self, query_embeddings: Any, kb_embeddings: Any) -> Any:
         """Compute distance matrix using vectorized operations"""
@@ -633,12 +680,15 @@ class EmbeddingStrategy(CrawlStrategy):
             kb_embeddings = kb_embeddings.reshape(1, -1)
             
         # Vectorized cosine distance: 1 - cosine_similarity
-        # Normalize vectors
-        query_norm = query_embeddings / np.linalg.norm(query_embeddings, axis=1, keepdims=True)
-        kb_norm = kb_embeddings / np.linalg.norm(kb_embeddings, axis=1, keepdims=True)
+        # Scale the raw dot products by precomputed inverse norms instead of
+        # materializing normalized copies of both matrices
+        inv_query_norms = 1.0 / np.linalg.norm(query_embeddings, axis=1)
+        inv_kb_norms = 1.0 / np.linalg.norm(kb_embeddings, axis=1)
         
         # Compute cosine similarity matrix
-        similarity_matrix = np.dot(query_norm, kb_norm.T)
+        similarity_matrix = np.dot(query_embeddings, kb_embeddings.T)
+        similarity_matrix *= inv_query_norms[:, None]
+        similarity_matrix *= inv_kb_norms[None, :]
         
         # Convert to distance
         distance_matrix = 1 - similarity_matrix
@@ -797,7 +847,7 @@ class EmbeddingStrategy(CrawlStrategy):
         
         # Create gaps list
         for i, q_emb in enumerate(query_embeddings):
-            gaps.append((q_emb, min_distances[i]))
+            gaps.append((q_emb, float(min_distances[i])))
                 
         return gaps
         
@@ -808,7 +858,7 @@ class EmbeddingStrategy(CrawlStrategy):
         kb_embeddings: Any
     ) -> List[Tuple[Link, float]]:
         """Select links that most efficiently fill the gaps"""
-        from .utils import cosine_distance, cosine_similarity, get_text_embeddings
+        from .utils import get_text_embeddings
         
         import hashlib
         
@@ -852,54 +902,60 @@ class EmbeddingStrategy(CrawlStrategy):
             # Cache the new embeddings
             for link, text, embedding in zip(links_to_embed, texts_to_embed, new_embeddings):
                 cache_key = hashlib.md5(f"{link.href}:{text}".encode()).hexdigest()
+                embedding = np.asarray(embedding, dtype=np.float32)
                 self._link_embedding_cache[cache_key] = embedding
                 link_embeddings_map[link.href] = embedding
         
         # Get coverage radius from config
         coverage_radius = self.config.embedding_coverage_radius if hasattr(self, 'config') else 0.2
         
+        # Skip links without embeddings
+        links_to_score = [link for link in candidate_links if link.href in link_embeddings_map]
+        
+        # Normalize link embeddings once; reused for gap and KB overlap scoring
+        L = None
+        if links_to_score:
+            L = np.asarray([link_embeddings_map[link.href] for link in links_to_score], dtype=np.float32)
+            L /= np.linalg.norm(L, axis=1, keepdims=True) + 1e-8
+        
+        # Gap reduction for all links at once: a single (links x gaps) cosine distance matrix
+        gap_reduction_scores = np.zeros(len(links_to_score))
+        # Only consider gaps that actually need filling (outside coverage radius)
+        open_gaps = [(gap_point, gap_distance) for gap_point, gap_distance in gaps
+                     if gap_distance > coverage_radius]
+        if L is not None and open_gaps:
+            G = np.asarray([gap_point for gap_point, _ in open_gaps], dtype=np.float32)
+            gap_distances = np.asarray([gap_distance for _, gap_distance in open_gaps], dtype=np.float32)
+            G /= np.linalg.norm(G, axis=1, keepdims=True) + 1e-8
+            new_distances = 1 - L @ G.T
+            
+            # A link helps a gap when it is closer than the current best;
+            # scale improvement - moving from 0.5 to 0.3 is valuable
+            improvements = np.maximum(gap_distances - new_distances, 0) * 2  # Amplify the signal
+            
+            # Average improvement per gap that needs help
+            gap_reduction_scores = improvements.sum(axis=1) / len(open_gaps)
+        
+        # Overlap with existing KB: normalize the KB once, not once per link
+        has_kb = kb_embeddings is not None and len(kb_embeddings) > 0
+        max_kb_similarities = np.zeros(len(links_to_score))
+        if L is not None and has_kb:
+            kb_norm = np.asarray(kb_embeddings, dtype=np.float32)
+            kb_norm = kb_norm / (np.linalg.norm(kb_norm, axis=1, keepdims=True) + 1e-8)
+            max_kb_similarities = (L @ kb_norm.T).max(axis=1)
+        
         # Score each link
-        for link in candidate_links:
-            if link.href not in link_embeddings_map:
-                continue  # Skip links without embeddings
-                
-            link_embedding = link_embeddings_map[link.href]
-            
+        for link, gap_reduction_score, max_similarity in zip(
+            links_to_score, gap_reduction_scores, max_kb_similarities
+        ):
             if not gaps:
                 score = 0.0
             else:
-                # Calculate how many gaps this link helps with
-                gaps_helped = 0
-                total_improvement = 0
+                gap_reduction_score = float(gap_reduction_score)
                 
-                for gap_point, gap_distance in gaps:
-                    # Only consider gaps that actually need filling (outside coverage radius)
-                    if gap_distance > coverage_radius:
-                        new_distance = cosine_distance(link_embedding, gap_point)
-                        if new_distance < gap_distance:
-                            # This link helps this gap
-                            improvement = gap_distance - new_distance
-                            # Scale improvement - moving from 0.5 to 0.3 is valuable
-                            scaled_improvement = improvement * 2  # Amplify the signal
-                            total_improvement += scaled_improvement
-                            gaps_helped += 1
-                
-                # Average improvement per gap that needs help
-                gaps_needing_help = sum(1 for _, d in gaps if d > coverage_radius)
-                if gaps_needing_help > 0:
-                    gap_reduction_score = total_improvement / gaps_needing_help
-                else:
-                    gap_reduction_score = 0
-                
-                # Check overlap with existing KB (vectorized)
-                if kb_embeddings is not None and len(kb_embeddings) > 0:
-                    # Normalize embeddings
-                    link_norm = link_embedding / np.linalg.norm(link_embedding)
-                    kb_norm = kb_embeddings / np.linalg.norm(kb_embeddings, axis=1, keepdims=True)
-                    
-                    # Compute all similarities at once
-                    similarities = np.dot(kb_norm, link_norm)
-                    max_similarity = np.max(similarities)
+                # Check overlap with existing KB
+                if has_kb:
+                    max_similarity = float(max_similarity)
                     
                     # Only penalize if very similar (above threshold)
                     overlap_threshold = self.config.embedding_overlap_threshold if hasattr(self, 'config') else 0.85
@@ -1043,7 +1099,7 @@ class EmbeddingStrategy(CrawlStrategy):
             state.kb_embeddings, 
             state.query_embeddings
         )
-        state.semantic_gaps = [(g[0].tolist(), g[1]) for g in gaps]  # Store as list for serialization
+        state.semantic_gaps = [(g[0].tolist(), float(g[1])) for g in gaps]  # Store as list for serialization
         
         # Select links that fill gaps (only from uncrawled)
         return await self.select_links_for_expansion(
@@ -1083,7 +1139,7 @@ class EmbeddingStrategy(CrawlStrategy):
         # k_exp = self.config.embedding_k_exp if hasattr(self, 'config') else 1.0
         # scores = np.exp(-k_exp * min_distances)
         
-        validation_confidence = np.mean(scores)
+        validation_confidence = float(np.mean(scores))
         state.metrics['validation_confidence'] = validation_confidence
         
         return validation_confidence
@@ -1166,58 +1222,80 @@ class EmbeddingStrategy(CrawlStrategy):
             
         return confidence
     
+    @staticmethod
+    def _kb_text(result: CrawlResult) -> str:
+        """Text of a result as it is embedded into the KB"""
+        content = result.markdown.raw_markdown if hasattr(result, 'markdown') and result.markdown else ""
+        return content[:5000]  # Limit text length
+    
+    def _get_kb_content_hashes(self, state: CrawlState) -> Set[int]:
+        """Hashes of the texts embedded into this state's KB
+        
+        The strategy outlives a single digest() run, so the set is rebuilt from
+        the state's embedded pages whenever a different state is passed in.
+        """
+        if state is not self._kb_hashes_state:
+            embedded_urls = set(state.crawl_order)
+            self._kb_content_hashes = {
+                xxhash.xxh3_64_intdigest(text)
+                for text in (self._kb_text(r) for r in state.knowledge_base if r.url in embedded_urls)
+                if text
+            }
+            self._kb_hashes_state = state
+        return self._kb_content_hashes
+    
     async def update_state(self, state: CrawlState, new_results: List[CrawlResult]) -> None:
         """Update embeddings and coverage metrics with deduplication"""
-        from .utils import get_text_embeddings
-        
+        kb_hashes = self._get_kb_content_hashes(state)
         
         # Extract text from results
         new_texts = []
+        new_hashes = []
         valid_results = []
         for result in new_results:
-            content = result.markdown.raw_markdown if hasattr(result, 'markdown') and result.markdown else ""
-            if content:  # Only process non-empty content
-                new_texts.append(content[:5000])  # Limit text length
+            text = self._kb_text(result)
+            if text:  # Only process non-empty content
+                # Exact duplicates of already embedded content are skipped before embedding
+                text_hash = xxhash.xxh3_64_intdigest(text)
+                if text_hash in kb_hashes or text_hash in new_hashes:
+                    continue
+                new_texts.append(text)
+                new_hashes.append(text_hash)
                 valid_results.append(result)
             
         if not new_texts:
             return
             
         # Get embeddings for new texts
-        embedding_llm_config = {
-            'provider': 'openai/text-embedding-3-small',
-            'api_token': os.getenv('OPENAI_API_KEY')
-        }        
-        new_embeddings = await get_text_embeddings(new_texts, embedding_llm_config, self.embedding_model)
+        new_embeddings = await self._get_embeddings(new_texts)
 
+        # Drop degenerate (all-zero) embeddings once, so neither the dedup below
+        # nor later scoring has to guard every normalization against zero norms
+        valid_rows = np.flatnonzero(np.any(new_embeddings, axis=1))
+        
         # Deduplicate embeddings before adding to KB
-        if state.kb_embeddings is None:
+        if state.kb_embeddings is None or len(state.kb_embeddings) == 0:
             # First batch - no deduplication needed
-            state.kb_embeddings = new_embeddings
-            deduplicated_indices = list(range(len(new_embeddings)))
+            state.kb_embeddings = new_embeddings[valid_rows]
+            deduplicated_indices = valid_rows.tolist()
         else:
-            # Check for duplicates using vectorized similarity
-            deduplicated_embeddings = []
-            deduplicated_indices = []
-            
-            for i, new_emb in enumerate(new_embeddings):
-                # Compute similarities with existing KB
-                new_emb_normalized = new_emb / np.linalg.norm(new_emb)
-                kb_normalized = state.kb_embeddings / np.linalg.norm(state.kb_embeddings, axis=1, keepdims=True)
-                similarities = np.dot(kb_normalized, new_emb_normalized)
-                
-                # Only add if not too similar to existing content
-                if np.max(similarities) < self._kb_similarity_threshold:
-                    deduplicated_embeddings.append(new_emb)
-                    deduplicated_indices.append(i)
+            # Check for duplicates against the whole KB in one matmul
+            kb_normalized = state.kb_embeddings / np.linalg.norm(state.kb_embeddings, axis=1, keepdims=True)
+            candidates = new_embeddings[valid_rows]
+            candidates_normalized = candidates / np.linalg.norm(candidates, axis=1, keepdims=True)
+            max_similarities = (candidates_normalized @ kb_normalized.T).max(axis=1, initial=-1.0)
+            
+            # Only add if not too similar to existing content
+            deduplicated_indices = valid_rows[max_similarities < self._kb_similarity_threshold].tolist()
             
             # Add deduplicated embeddings
-            if deduplicated_embeddings:
-                state.kb_embeddings = np.vstack([state.kb_embeddings, np.array(deduplicated_embeddings)])
+            if deduplicated_indices:
+                state.kb_embeddings = np.vstack([state.kb_embeddings, new_embeddings[deduplicated_indices]])
         
-        # Update crawl order only for non-duplicate results
+        # Update crawl order and content hashes only for results that entered the KB
         for idx in deduplicated_indices:
             state.crawl_order.append(valid_results[idx].url)
+            kb_hashes.add(new_hashes[idx])
         
         # Invalidate distance matrix cache since KB changed
         self._kb_embeddings_hash = None
@@ -1250,6 +1328,9 @@ class AdaptiveCrawler:
         
         # Track if we own the crawler (for cleanup)
         self._owns_crawler = crawler is None
+        
+        # In-flight background checkpoint write (see _schedule_checkpoint)
+        self._checkpoint_task: Optional[asyncio.Task] = None
     
     def _create_strategy(self, strategy_name: str) -> CrawlStrategy:
         """Create strategy instance based on name"""
@@ -1383,7 +1464,7 @@ class AdaptiveCrawler:
                 
                 # Save state if configured
                 if self.config.save_state and self.config.state_path:
-                    self.state.save(self.config.state_path)
+                    self._schedule_checkpoint()
             
             # Final confidence calculation
             learning_score = await self.strategy.calculate_confidence(self.state)
@@ -1400,18 +1481,58 @@ class AdaptiveCrawler:
             
             # Final save
             if self.config.save_state and self.config.state_path:
-                self.state.save(self.config.state_path)
+                await self._flush_checkpoint()
+                await asyncio.to_thread(
+                    CrawlState._write_state_dict, self.config.state_path, self.state.to_dict()
+                )
             
             return self.state
             
         finally:
+            # Don't let a checkpoint error mask the one that got us here
+            await self._flush_checkpoint(raise_errors=False)
             # Cleanup if we created the crawler
             if self._owns_crawler and self.crawler:
                 await self.crawler.__aexit__(None, None, None)
     
-    async def _crawl_with_preview(self, url: str, query: str) -> Optional[CrawlResult]:
-        """Crawl a URL with link preview enabled"""
-        config = CrawlerRunConfig(
+    def _schedule_checkpoint(self) -> None:
+        """Write an intermediate state checkpoint in a worker thread.
+        
+        The snapshot (a copy, see CrawlState.to_dict) is taken on the event loop
+        so the crawl can keep mutating the state while the file is written. If
+        the previous checkpoint is still being written this one is skipped; the
+        final save always persists the latest state. A failed previous write is
+        re-raised here, as a synchronous save would have raised.
+        """
+        if self._checkpoint_task is not None:
+            if not self._checkpoint_task.done():
+                return
+            task, self._checkpoint_task = self._checkpoint_task, None
+            task.result()
+        self._checkpoint_task = asyncio.create_task(asyncio.to_thread(
+            CrawlState._write_state_dict, self.config.state_path, self.state.to_dict()
+        ))
+    
+    async def _flush_checkpoint(self, raise_errors: bool = True) -> None:
+        """Wait for any in-flight checkpoint write to finish
+        
+        A failed write is re-raised unless raise_errors is False.
+        """
+        if self._checkpoint_task is not None:
+            task, self._checkpoint_task = self._checkpoint_task, None
+            try:
+                await task
+            except Exception:
+                if raise_errors:
+                    raise
+    
+    def _build_preview_config(self, query: str) -> CrawlerRunConfig:
+        """Run config for crawling with link preview enabled
+        
+        Built once per query/batch and shared by every URL; callers must not
+        mutate it per URL.
+        """
+        return CrawlerRunConfig(
             link_preview_config=LinkPreviewConfig(
                 include_internal=True,
                 include_external=False,
@@ -1423,6 +1544,11 @@ class AdaptiveCrawler:
             ),
             score_links=True  # Enable intrinsic scoring
         )
+    
+    async def _crawl_with_preview(self, url: str, query: str,
+                                  config: Optional[CrawlerRunConfig] = None) -> Optional[CrawlResult]:
+        """Crawl a URL with link preview enabled"""
+        config = config or self._build_preview_config(query)
         
         try:
             result = await self.crawler.arun(url=url, config=config)
@@ -1443,9 +1569,10 @@ class AdaptiveCrawler:
     
     async def _crawl_batch(self, links_with_scores: List[Tuple[Link, float]], query: str) -> List[CrawlResult]:
         """Crawl multiple URLs in parallel"""
+        config = self._build_preview_config(query)
         tasks = []
         for link, score in links_with_scores:
-            task = self._crawl_with_preview(link.href, query)
+            task = self._crawl_with_preview(link.href, query, config)
             tasks.append(task)
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -1856,6 +1983,5 @@ class AdaptiveCrawler:
                 'index': i
             })
         
-        # Sort by score and return top K
-        scored_docs.sort(key=lambda x: x['score'], reverse=True)
-        return scored_docs[:top_k]
\ No newline at end of file
+        # Select top K without sorting the whole knowledge base
+        return heapq.nlargest(top_k, scored_docs, key=lambda x: x['score'])
\ No newline at end of file
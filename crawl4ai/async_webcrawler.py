@@ -615,7 +615,11 @@ class AsyncWebCrawler:
                 else config.chunking_strategy
             )
             sections = chunking.chunk(content)
-            extracted_content = config.extraction_strategy.run(url, sections)
+            # Extraction is blocking (HTML parsing, synchronous LLM calls), so run
+            # it in a worker thread to keep the event loop serving other crawls
+            extracted_content = await asyncio.to_thread(
+                config.extraction_strategy.run, url, sections
+            )
             extracted_content = json.dumps(
                 extracted_content, indent=4, default=str, ensure_ascii=False
             )
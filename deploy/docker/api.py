@@ -40,7 +40,6 @@ from utils import (
     get_base_url,
     is_task_id,
     should_cleanup_task,
-    decode_redis_hash,
     get_llm_api_key,
     validate_llm_provider
 )
@@ -306,7 +305,6 @@ async def handle_task_status(
             detail="Task not found"
         )
 
-    task = decode_redis_hash(task)
     response = create_task_response(task, task_id, base_url)
 
     if task["status"] in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
@@ -3,7 +3,7 @@ Job endpoints (enqueue + poll) for long-running LL​M extraction and raw crawl.
 Relies on the existing Redis task helpers in api.py
 """
 
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional
 from fastapi import APIRouter, BackgroundTasks, Depends, Request
 from pydantic import BaseModel, HttpUrl
 
@@ -16,7 +16,6 @@ from api import (
 # ------------- dependency placeholders -------------
 _redis = None        # will be injected from server.py
 _config = None
-_token_dep: Callable = lambda: None  # dummy until injected
 
 # public router
 router = APIRouter()
@@ -25,9 +24,13 @@ router = APIRouter()
 # === init hook called by server.py =========================================
 def init_job_router(redis, config, token_dep) -> APIRouter:
     """Inject shared singletons and return the router for mounting."""
-    global _redis, _config, _token_dep
-    _redis, _config, _token_dep = redis, config, token_dep
-    return router
+    global _redis, _config
+    _redis, _config = redis, config
+    # auth is attached once for every job route, so FastAPI resolves the
+    # real dependency (and its own sub-dependencies) directly
+    authed = APIRouter(dependencies=[Depends(token_dep)])
+    authed.include_router(router)
+    return authed
 
 
 # ---------- payload models --------------------------------------------------
@@ -51,7 +54,6 @@ async def llm_job_enqueue(
         payload: LlmJobPayload,
         background_tasks: BackgroundTasks,
         request: Request,
-        _td: Dict = Depends(lambda: _token_dep()),   # late-bound dep
 ):
     return await handle_llm_request(
         _redis,
@@ -70,7 +72,6 @@ async def llm_job_enqueue(
 async def llm_job_status(
     request: Request,
     task_id: str,
-    _td: Dict = Depends(lambda: _token_dep())
 ):
     return await handle_task_status(_redis, task_id)
 
@@ -80,7 +81,6 @@ async def llm_job_status(
 async def crawl_job_enqueue(
         payload: CrawlJobPayload,
         background_tasks: BackgroundTasks,
-        _td: Dict = Depends(lambda: _token_dep()),
 ):
     return await handle_crawl_job(
         _redis,
@@ -96,6 +96,5 @@ async def crawl_job_enqueue(
 async def crawl_job_status(
     request: Request,
     task_id: str,
-    _td: Dict = Depends(lambda: _token_dep())
 ):
     return await handle_task_status(_redis, task_id, base_url=str(request.base_url))
@@ -135,7 +135,17 @@ async def root():
     return RedirectResponse("/playground")
 
 # ─────────────────── infra / middleware  ─────────────────────
-redis = aioredis.from_url(config["redis"].get("uri", "redis://localhost"))
+# bounded, blocking pool: bursts of enqueues/polls wait for a free connection
+# instead of failing, and idle sockets are kept alive and health-checked
+redis_pool = aioredis.BlockingConnectionPool.from_url(
+    config["redis"].get("uri", "redis://localhost"),
+    max_connections=config["redis"].get("max_connections", 64),
+    timeout=config["redis"].get("pool_timeout", 20),
+    socket_keepalive=config["redis"].get("socket_keepalive", True),
+    health_check_interval=config["redis"].get("health_check_interval", 30),
+    decode_responses=True,
+)
+redis = aioredis.Redis(connection_pool=redis_pool)
 
 limiter = Limiter(
     key_func=get_remote_address,
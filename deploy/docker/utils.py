@@ -65,11 +65,6 @@ def should_cleanup_task(created_at: str, ttl_seconds: int = 3600) -> bool:
     created = datetime.fromisoformat(created_at)
     return (datetime.now() - created).total_seconds() > ttl_seconds
 
-def decode_redis_hash(hash_data: Dict[bytes, bytes]) -> Dict[str, str]:
-    """Decode Redis hash data from bytes to strings."""
-    return {k.decode('utf-8'): v.decode('utf-8') for k, v in hash_data.items()}
-
-
 
 def get_llm_api_key(config: Dict, provider: Optional[str] = None) -> str:
     """Get the appropriate API key based on the LLM provider.
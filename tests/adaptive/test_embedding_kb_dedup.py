@@ -0,0 +1,105 @@
+"""
+Tests for content-hash deduplication in EmbeddingStrategy.update_state
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from crawl4ai.adaptive_crawler import EmbeddingStrategy, CrawlState
+
+
+class MockMarkdown:
+    def __init__(self, content):
+        self.raw_markdown = content
+
+
+class MockResult:
+    def __init__(self, url, content):
+        self.url = url
+        self.markdown = MockMarkdown(content)
+        self.success = True
+
+
+class StubEmbeddingStrategy(EmbeddingStrategy):
+    """Deterministic embeddings, so no model or API is needed"""
+
+    def __init__(self, fail_times: int = 0):
+        super().__init__()
+        self.fail_times = fail_times
+        self.embedded_texts = []
+
+    async def _get_embeddings(self, texts):
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("embedding backend unavailable")
+        self.embedded_texts.extend(texts)
+        rng = np.random.default_rng(abs(hash(tuple(texts))) % (2 ** 32))
+        return rng.standard_normal((len(texts), 16)).astype(np.float32)
+
+
+async def _digest(strategy, state, results):
+    state.knowledge_base.extend(results)
+    await strategy.update_state(state, results)
+
+
+@pytest.mark.asyncio
+async def test_new_state_embeds_pages_seen_by_previous_state():
+    strategy = StubEmbeddingStrategy()
+    page = MockResult("https://example.com/a", "async await coroutines " * 20)
+
+    first = CrawlState(query="async")
+    await _digest(strategy, first, [page])
+    assert first.crawl_order == [page.url]
+
+    # A later digest() run starts from a fresh state with the same page
+    second = CrawlState(query="async")
+    await _digest(strategy, second, [page])
+    assert second.kb_embeddings is not None and len(second.kb_embeddings) == 1
+    assert second.crawl_order == [page.url]
+
+
+@pytest.mark.asyncio
+async def test_exact_duplicates_are_skipped_before_embedding():
+    strategy = StubEmbeddingStrategy()
+    state = CrawlState(query="async")
+    text = "event loops and tasks " * 20
+
+    await _digest(strategy, state, [MockResult("https://example.com/a", text)])
+    await _digest(strategy, state, [MockResult("https://example.com/b", text)])
+
+    assert strategy.embedded_texts == [text[:5000]]
+    assert state.crawl_order == ["https://example.com/a"]
+
+
+@pytest.mark.asyncio
+async def test_failed_embedding_does_not_blacklist_page():
+    strategy = StubEmbeddingStrategy(fail_times=1)
+    state = CrawlState(query="async")
+    page = MockResult("https://example.com/a", "async await coroutines " * 20)
+
+    with pytest.raises(RuntimeError):
+        await strategy.update_state(state, [page])
+
+    await strategy.update_state(state, [page])
+    assert state.crawl_order == [page.url]
+    assert len(state.kb_embeddings) == 1
+
+
+@pytest.mark.asyncio
+async def test_loaded_state_rebuilds_hashes_from_embedded_pages():
+    strategy = StubEmbeddingStrategy()
+    text = "event loops and tasks " * 20
+    state = CrawlState(query="async")
+    await _digest(strategy, state, [MockResult("https://example.com/a", text)])
+
+    # A resumed crawl hands a fresh strategy the previously embedded pages
+    resumed = StubEmbeddingStrategy()
+    await _digest(resumed, state, [MockResult("https://example.com/b", text)])
+    assert resumed.embedded_texts == []
+    assert state.crawl_order == ["https://example.com/a"]
@@ -0,0 +1,136 @@
+"""
+Tests for background state checkpoints in AdaptiveCrawler
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from crawl4ai import AdaptiveConfig, AdaptiveCrawler
+from crawl4ai.adaptive_crawler import CrawlState, EmbeddingStrategy
+from crawl4ai.models import Link
+
+
+class MockMarkdown:
+    def __init__(self, content):
+        self.raw_markdown = content
+
+
+class MockResult:
+    def __init__(self, url, content):
+        self.url = url
+        self.markdown = MockMarkdown(content)
+        self.links = {"internal": [{"href": f"{url}/next"}], "external": []}
+        self.metadata = {"title": "page"}
+
+
+def test_to_dict_does_not_share_mutable_containers():
+    state = CrawlState(query="async python")
+    state.metrics["confidence"] = 0.5
+    state.crawl_order.append("https://example.com")
+    state.knowledge_base.append(MockResult("https://example.com", "content"))
+
+    snapshot = state.to_dict()
+
+    assert snapshot["metrics"] is not state.metrics
+    assert snapshot["crawl_order"] is not state.crawl_order
+    assert snapshot["new_terms_history"] is not state.new_terms_history
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_ignores_mutations_during_write(tmp_path, monkeypatch):
+    state_path = tmp_path / "state.json"
+    adaptive = AdaptiveCrawler(
+        config=AdaptiveConfig(save_state=True, state_path=str(state_path))
+    )
+    adaptive.state = CrawlState(query="async python")
+    adaptive.state.metrics["confidence"] = 0.5
+    adaptive.state.knowledge_base.append(MockResult("https://example.com", "content"))
+
+    # Hold the worker thread until the crawl has mutated the state
+    release = threading.Event()
+    write_state_dict = CrawlState._write_state_dict
+
+    def slow_write(path, state_dict):
+        release.wait(timeout=5)
+        write_state_dict(path, state_dict)
+
+    monkeypatch.setattr(CrawlState, "_write_state_dict", staticmethod(slow_write))
+
+    adaptive._schedule_checkpoint()
+    adaptive.state.metrics["stopped_reason"] = "max_pages"
+    adaptive.state.metrics.update({f"extra_{i}": i for i in range(100)})
+    adaptive.state.crawl_order.append("https://example.com/late")
+    release.set()
+
+    task = adaptive._checkpoint_task
+    await adaptive._flush_checkpoint()
+    assert task.exception() is None
+
+    saved = json.loads(state_path.read_text())
+    assert saved["metrics"] == {"confidence": 0.5}
+    assert saved["crawl_order"] == []
+
+
+@pytest.mark.asyncio
+async def test_failed_checkpoint_is_reraised(tmp_path, monkeypatch):
+    adaptive = AdaptiveCrawler(
+        config=AdaptiveConfig(save_state=True, state_path=str(tmp_path / "state.json"))
+    )
+    adaptive.state = CrawlState(query="async python")
+
+    def failing_write(path, state_dict):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(CrawlState, "_write_state_dict", staticmethod(failing_write))
+
+    # Surfaces from the final flush...
+    adaptive._schedule_checkpoint()
+    with pytest.raises(OSError):
+        await adaptive._flush_checkpoint()
+
+    # ...and from the next checkpoint once the failed one has finished
+    adaptive._schedule_checkpoint()
+    await asyncio.wait([adaptive._checkpoint_task])
+    with pytest.raises(OSError):
+        adaptive._schedule_checkpoint()
+
+
+@pytest.mark.asyncio
+async def test_embedding_state_is_json_serializable(monkeypatch):
+    # API backends return float64 vectors; the strategy caches them as float32
+    async def fake_text_embeddings(texts, llm_config=None, model_name=None):
+        rng = np.random.default_rng(len(texts))
+        return rng.standard_normal((len(texts), 16))
+
+    monkeypatch.setattr("crawl4ai.utils.get_text_embeddings", fake_text_embeddings)
+
+    strategy = EmbeddingStrategy()
+    strategy._validation_queries = ["event loop internals"]
+    state = CrawlState(query="async python")
+    state.query_embeddings = await strategy._get_embeddings(["async python", "asyncio tasks"])
+
+    results = [
+        MockResult(f"https://example.com/{i}", f"page {i} about coroutines " * 20)
+        for i in range(3)
+    ]
+    state.knowledge_base.extend(results)
+    await strategy.update_state(state, results)
+    state.pending_links = [
+        Link(href=f"https://example.com/next{i}", text=f"next {i}") for i in range(3)
+    ]
+
+    await strategy.rank_links(state, AdaptiveConfig(strategy="embedding"))
+    await strategy.calculate_confidence(state)
+    await strategy.validate_coverage(state)
+
+    assert state.semantic_gaps
+    json.dumps(state.to_dict())